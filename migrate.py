@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Add site controls (text-size control and dark mode toggle) to all HTML pages in Habitat docs
+
+Usage: migrate.py [-v] [all | text-size | dark-mode]
+
+`all` (the default) reads each page once, applies both edits in memory and
+writes the page back once. `text-size` and `dark-mode` run a single step;
+add-text-size-control.py and add-dark-mode-toggle.py are shortcuts for them.
+
+Pages are edited by splicing bytes at a few literal anchors rather than
+through an HTML parser: serializing a parsed tree would rewrite quoting,
+whitespace and entities throughout every page, while splicing leaves
+everything outside the inserted controls byte-for-byte intact.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import stat
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+WORKSPACE_DIR = Path('/root/.openclaw/workspace/habitat')
+DOCS_DIR = WORKSPACE_DIR / 'docs'
+
+# Cached listing of the docs tree, shared by every entry point
+HTML_MANIFEST = WORKSPACE_DIR / '.html_manifest'
+
+# Per-worker record of pages already migrated, as {worker: {path: mtime_ns}}
+MIGRATED_SIDECAR = WORKSPACE_DIR / '.habitat-migrated.json'
+
+TEXT_SIZE_CONTROL = '''
+  <!-- Text Size Adjustment Tool -->
+  <div class="text-size-control">
+    <button class="text-size-btn" onclick="adjustTextSize('decrease')" aria-label="Decrease text size">
+      <i data-lucide="minus"></i>
+    </button>
+    <button class="text-size-btn active" onclick="adjustTextSize('reset')" aria-label="Reset text size">
+      <i data-lucide="type"></i>
+    </button>
+    <button class="text-size-btn" onclick="adjustTextSize('increase')" aria-label="Increase text size">
+      <i data-lucide="plus"></i>
+    </button>
+  </div>
+  <script>
+  (function() {
+    const sizes = ['small', 'normal', 'large'];
+    const fontSizes = { small: '15px', normal: '16px', large: '18px' };
+    
+    function adjustTextSize(action) {
+      let currentSize = localStorage.getItem('textSize') || 'normal';
+      let newSize = currentSize;
+      
+      if (action === 'decrease') {
+        if (currentSize === 'normal') newSize = 'small';
+        else if (currentSize === 'large') newSize = 'normal';
+      } else if (action === 'increase') {
+        if (currentSize === 'small') newSize = 'normal';
+        else if (currentSize === 'normal') newSize = 'large';
+      } else if (action === 'reset') {
+        newSize = 'normal';
+      }
+      
+      localStorage.setItem('textSize', newSize);
+      applyTextSize(newSize);
+      updateButtons(newSize);
+    }
+    
+    function applyTextSize(size) {
+      document.documentElement.style.fontSize = fontSizes[size];
+    }
+    
+    function updateButtons(size) {
+      const buttons = document.querySelectorAll('.text-size-btn');
+      buttons.forEach(btn => btn.classList.remove('active'));
+      
+      if (size === 'small') buttons[0].classList.add('active');
+      else if (size === 'normal') buttons[1].classList.add('active');
+      else if (size === 'large') buttons[2].classList.add('active');
+    }
+    
+    // Initialize on page load
+    const savedSize = localStorage.getItem('textSize') || 'normal';
+    applyTextSize(savedSize);
+    
+    // Update buttons after lucide icons are loaded
+    document.addEventListener('DOMContentLoaded', () => {
+      updateButtons(savedSize);
+    });
+    
+    // Make function globally available
+    window.adjustTextSize = adjustTextSize;
+  })();
+  </script>
+'''
+
+DARK_MODE_TOGGLE_AND_SCRIPT = '''  </div><!-- /site-controls -->
+  <script>
+  (function() {
+    function toggleTheme() {
+      var isDark = document.documentElement.getAttribute("data-theme") === "dark";
+      var newTheme = isDark ? "light" : "dark";
+      document.documentElement.setAttribute("data-theme", newTheme);
+      localStorage.setItem("theme", newTheme);
+      lucide.createIcons();
+    }
+    var saved = localStorage.getItem("theme");
+    if (saved === "dark" || (!saved && window.matchMedia("(prefers-color-scheme: dark)").matches)) {
+      document.documentElement.setAttribute("data-theme", "dark");
+    }
+    window.toggleTheme = toggleTheme;
+  })();
+  </script>
+'''
+
+THEME_TOGGLE_BUTTON = '''<button class="theme-toggle" onclick="toggleTheme()" aria-label="Toggle dark mode">
+    <span class="icon-sun"><i data-lucide="sun"></i></span>
+    <span class="icon-moon"><i data-lucide="moon"></i></span>
+  </button>
+  '''
+
+# Pages are edited as raw bytes; every anchor and template is ASCII, so
+# there is no need to decode and re-encode whole files
+TEXT_SIZE_CONTROL_BYTES = TEXT_SIZE_CONTROL.encode('utf-8')
+THEME_TOGGLE_BUTTON_BYTES = THEME_TOGGLE_BUTTON.encode('utf-8')
+SITE_CONTROLS_OPEN = b'<div class="site-controls">\n  '
+
+# Literal anchors, located with bytes.find rather than a regex
+LUCIDE_SCRIPT = b'<script>lucide.createIcons();</script>'
+BODY_CLOSE = b'</body>'
+TEXT_SIZE_COMMENT = b'<!-- Text Size Adjustment Tool -->'
+TEXT_SIZE_DIV = b'<div class="text-size-control">'
+SITE_CONTROLS_DIV = b'<div class="site-controls">'
+
+# Markers whose presence means a step has already been applied
+TEXT_SIZE_MARKER = b'text-size-control'
+DARK_MODE_MARKER = b'toggleTheme'
+TEXT_SIZE_DONE = ('skipped', "already has text-size control")
+DARK_MODE_DONE = ('skipped', "already has dark mode toggle")
+
+# The closing script boundary: the end of the text-size script, then the
+# lucide.createIcons() call, each token separated by optional whitespace
+ADJUST_TEXT_SIZE_EXPORT = b'window.adjustTextSize = adjustTextSize;'
+SCRIPT_BOUNDARY_TOKENS = (b'})();', b'</script>')
+
+# The same tokens with the exact whitespace TEXT_SIZE_CONTROL emits, which
+# is what nearly every page has: `window.adjustTextSize ... </script>`
+GENERATED_SCRIPT_END = TEXT_SIZE_CONTROL_BYTES[
+    TEXT_SIZE_CONTROL_BYTES.rindex(ADJUST_TEXT_SIZE_EXPORT):].rstrip()
+
+# Replaces the whitespace between that </script> and the lucide call;
+# spliced in as plain bytes so no replacement template is expanded per page
+DARK_MODE_SCRIPT_INSERT = b'\n\n' + DARK_MODE_TOGGLE_AND_SCRIPT.encode('utf-8') + b'\n\n'
+
+WHITESPACE = b' \t\n\r\f\v'
+
+def skip_whitespace(content, i):
+    """Return the index of the first non-whitespace byte at or after i"""
+    while i < len(content) and content[i] in WHITESPACE:
+        i += 1
+    return i
+
+def find_after_whitespace(content, head, tail):
+    """Return the index of the first `tail` that follows `head` and optional whitespace, or -1"""
+    i = content.find(head)
+    while i >= 0:
+        k = skip_whitespace(content, i + len(head))
+        if content.startswith(tail, k):
+            return k
+        i = content.find(head, i + 1)
+    return -1
+
+def find_insertion_point(content):
+    """Return the index where the text-size control goes, or -1 if there is no anchor.
+
+    That is the start of the whitespace run preceding a lucide.createIcons()
+    script which is itself followed (modulo whitespace) by </body>.
+    """
+    i = content.find(LUCIDE_SCRIPT)
+    while i >= 0:
+        k = skip_whitespace(content, i + len(LUCIDE_SCRIPT))
+        if content.startswith(BODY_CLOSE, k):
+            while i > 0 and content[i - 1] in WHITESPACE:
+                i -= 1
+            return i
+        i = content.find(LUCIDE_SCRIPT, i + 1)
+    return -1
+
+def find_script_boundary(content, start=0):
+    """Locate the closing script boundary at or after start, without a regex
+
+    Walks `window.adjustTextSize = adjustTextSize; })(); </script>
+    <script>lucide.createIcons();</script>` token by token, allowing any
+    whitespace in between. Returns (end of that </script>, start of the
+    lucide script), or None if there is no such boundary.
+    """
+    # Fast path: the script as generated by TEXT_SIZE_CONTROL is one literal,
+    # so a single find replaces the token walk. It is only taken when no
+    # other export line comes first, so the result matches the walk below.
+    i = content.find(GENERATED_SCRIPT_END, start)
+    if i >= 0 and content.find(ADJUST_TEXT_SIZE_EXPORT, start, i) < 0:
+        k = i + len(GENERATED_SCRIPT_END)
+        lucide = skip_whitespace(content, k)
+        if content.startswith(LUCIDE_SCRIPT, lucide):
+            return k, lucide
+    
+    i = content.find(ADJUST_TEXT_SIZE_EXPORT, start)
+    while i >= 0:
+        k = i + len(ADJUST_TEXT_SIZE_EXPORT)
+        for token in SCRIPT_BOUNDARY_TOKENS:
+            k = skip_whitespace(content, k)
+            if not content.startswith(token, k):
+                break
+            k += len(token)
+        else:
+            lucide = skip_whitespace(content, k)
+            if content.startswith(LUCIDE_SCRIPT, lucide):
+                return k, lucide
+        i = content.find(ADJUST_TEXT_SIZE_EXPORT, i + 1)
+    return None
+
+def insert_text_size_control(content):
+    """Add text-size control to page content if not already present
+
+    Returns (edits, (status, note)) where status is 'updated', 'skipped' or
+    'failed', and edits are the (start, end, data) splices to apply with
+    splice().
+    """
+    # Skip if already has text-size-control
+    if TEXT_SIZE_MARKER in content:
+        return [], TEXT_SIZE_DONE
+    
+    # Insert the text-size control before the first lucide.createIcons() script
+    # followed by </body>
+    idx = find_insertion_point(content)
+    if idx < 0:
+        return [], ('failed', "could not find insertion point")
+    
+    return [(idx, idx, TEXT_SIZE_CONTROL_BYTES)], ('updated', "added text-size control")
+
+def insert_dark_mode_toggle(content, has_text_size_control=False):
+    """Add dark mode toggle to page content if not already present
+
+    `has_text_size_control` skips the probe for the text-size control when
+    the caller has just inserted it. Returns (edits, (status, note)) like
+    insert_text_size_control().
+    """
+    # Check if already has dark mode toggle
+    if DARK_MODE_MARKER in content:
+        return [], DARK_MODE_DONE
+    
+    # Check if has site-controls wrapper (from text-size control)
+    if not has_text_size_control and TEXT_SIZE_DIV not in content:
+        return [], ('failed', "missing text-size-control, skipping")
+    
+    if SITE_CONTROLS_DIV not in content:
+        # Wrap the text-size-control in site-controls, with the theme toggle first
+        idx = find_after_whitespace(content, TEXT_SIZE_COMMENT, TEXT_SIZE_DIV)
+        button = SITE_CONTROLS_OPEN + THEME_TOGGLE_BUTTON_BYTES
+        note = "added dark mode toggle"
+    elif b'<button class="theme-toggle"' not in content:
+        # Already has site-controls, just add the theme toggle before text-size-control
+        idx = find_after_whitespace(content, SITE_CONTROLS_DIV, TEXT_SIZE_DIV)
+        button = THEME_TOGGLE_BUTTON_BYTES
+        note = "added theme toggle button"
+    else:
+        return [], ('skipped', "already complete")
+    
+    if idx < 0:
+        return [], ('failed', "could not find theme toggle insertion point")
+    
+    # The closing wrapper and toggleTheme script go before the final
+    # lucide.createIcons() call. Both edits are needed for a working page, so
+    # nothing is changed unless that boundary is found too. (No separate probe
+    # for an existing closing wrapper is needed: it only ever comes from
+    # DARK_MODE_TOGGLE_AND_SCRIPT, which also defines toggleTheme.)
+    # The boundary comes after the button anchor, so it is only searched for
+    # from there.
+    boundary = find_script_boundary(content, idx)
+    if boundary is None:
+        return [], ('failed', "could not find closing script boundary")
+    script_end, lucide = boundary
+    
+    return [(idx, idx, button), (script_end, lucide, DARK_MODE_SCRIPT_INSERT)], ('updated', note)
+
+def splice(content, edits):
+    """Return the buffers that make up content with edits applied
+
+    edits are sorted, non-overlapping (start, end, data) tuples, each
+    replacing content[start:end] with data. The unchanged stretches are
+    memoryview slices, so content itself is never copied.
+    """
+    view = memoryview(content)
+    buffers = []
+    pos = 0
+    for start, end, data in edits:
+        buffers += [view[pos:start], data]
+        pos = end
+    buffers.append(view[pos:])
+    return buffers
+
+def read_page(html_path, *markers):
+    """Return the page content, or None if it already contains every marker
+
+    The markers are probed on a read-only mmap of the file, so pages that
+    are already migrated are never copied into a bytes object.
+    """
+    with open(html_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if all(mm.find(marker) >= 0 for marker in markers):
+                return None
+            return mm[:]
+
+def atomic_write(path, buffers):
+    """Replace the file at path with the concatenated buffers
+
+    The buffers are gathered by os.writev into a temporary sibling, which
+    then replaces the page with os.replace: they are never joined in memory,
+    and readers see either the old or the new page, never a truncated one.
+    A symlinked page is resolved first, so the link is kept and its target is
+    replaced. Only the permission bits are kept: the new file is owned by the
+    current user, and hard links to the old one are not updated.
+    """
+    path = os.path.realpath(path)
+    tmp = f'{path}.tmp'
+    mode = stat.S_IMODE(os.stat(path).st_mode)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        try:
+            os.fchmod(fd, mode)  # The mode given to os.open is masked by the umask
+            buffers = [memoryview(b) for b in buffers]
+            while buffers:
+                # writev may stop short; drop what was written and retry the rest
+                written = os.writev(fd, buffers)
+                while buffers and written >= len(buffers[0]):
+                    written -= len(buffers.pop(0))
+                if buffers:
+                    buffers[0] = buffers[0][written:]
+            if hasattr(os, 'posix_fadvise'):
+                # Keep rewritten pages from evicting hotter data from the page cache
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def finish_page(html_path, results, content=None, edits=()):
+    """Fold the results of each step into (status, complete, status line, update)
+
+    status is 'updated' if any step changed the page, else 'failed' if any
+    step failed, else 'skipped'; complete is False if any step failed, even
+    when another step updated the page; update is the (content, edits) pair
+    to write with splice() if the page was updated, else None. Writing and printing
+    are left to the caller, so workers only compute and output from
+    parallel workers does not interleave.
+    """
+    statuses = [status for status, _ in results]
+    if 'updated' in statuses:
+        status = 'updated'
+    elif 'failed' in statuses:
+        status = 'failed'
+    else:
+        status = 'skipped'
+    
+    complete = 'failed' not in statuses
+    mark = '✓' if complete else '✗'
+    notes = '; '.join(note for _, note in results)
+    update = (content, edits) if status == 'updated' else None
+    return status, complete, f"  {mark} {html_path} - {notes}", update
+
+def add_text_size_control(html_path):
+    """Add text-size control to an HTML file if not already present"""
+    content = read_page(html_path, TEXT_SIZE_MARKER)
+    if content is None:
+        return finish_page(html_path, [TEXT_SIZE_DONE])
+    edits, result = insert_text_size_control(content)
+    return finish_page(html_path, [result], content, edits)
+
+def add_dark_mode_toggle(html_path):
+    """Add dark mode toggle to an HTML file if not already present"""
+    content = read_page(html_path, DARK_MODE_MARKER)
+    if content is None:
+        return finish_page(html_path, [DARK_MODE_DONE])
+    edits, result = insert_dark_mode_toggle(content)
+    return finish_page(html_path, [result], content, edits)
+
+def text_size_with_dark_mode():
+    """Return what a freshly inserted text-size control becomes after the dark mode step
+
+    That is TEXT_SIZE_CONTROL with the theme toggle, closing wrapper and
+    toggleTheme script added, up to the lucide.createIcons() call after it.
+    """
+    page = TEXT_SIZE_CONTROL_BYTES + LUCIDE_SCRIPT
+    edits, _ = insert_dark_mode_toggle(page, has_text_size_control=True)
+    return b''.join(splice(page, edits))[:-len(LUCIDE_SCRIPT)]
+
+TEXT_SIZE_WITH_DARK_MODE = text_size_with_dark_mode()
+DARK_MODE_ADDED = ('updated', "added dark mode toggle")
+
+def apply_all(html_path):
+    """Add both the text-size control and the dark mode toggle in one pass over the page"""
+    content = read_page(html_path, TEXT_SIZE_MARKER, DARK_MODE_MARKER)
+    if content is None:
+        return finish_page(html_path, [TEXT_SIZE_DONE, DARK_MODE_DONE])
+    edits, text_size = insert_text_size_control(content)
+    
+    if edits and DARK_MODE_MARKER not in content and SITE_CONTROLS_DIV not in content:
+        # Every dark mode anchor lies inside the text-size control just
+        # inserted, so reuse its offset rather than searching the page again:
+        # the control and the whitespace before the lucide.createIcons() call
+        # become TEXT_SIZE_WITH_DARK_MODE
+        idx = edits[0][0]
+        lucide = skip_whitespace(content, idx)
+        return finish_page(html_path, [text_size, DARK_MODE_ADDED],
+                           content, [(idx, lucide, TEXT_SIZE_WITH_DARK_MODE)])
+    
+    if edits:
+        # The dark mode anchors are looked up in the page as it will be written
+        content = b''.join(splice(content, edits))
+    edits, dark_mode = insert_dark_mode_toggle(
+        content, has_text_size_control=text_size[0] == 'updated')
+    return finish_page(html_path, [text_size, dark_mode], content, edits)
+
+def iter_html(root, dir_mtimes=None):
+    """Yield the path of every HTML page under root, walking it with os.scandir
+
+    The text-size-control.html file itself is excluded. If dir_mtimes is
+    given, it is filled with the mtime of every directory visited.
+    """
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        if dir_mtimes is not None:
+            dir_mtimes[d] = os.stat(d).st_mtime_ns
+        with os.scandir(d) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.html') and entry.name != 'text-size-control.html':
+                    yield entry.path
+
+def load_manifest(docs_dir, manifest_path=HTML_MANIFEST):
+    """Return the cached listing of docs_dir, or None if there is no usable one"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (isinstance(manifest, dict) and manifest.get('docs_dir') == str(docs_dir)
+            and isinstance(manifest.get('dirs'), dict)
+            and isinstance(manifest.get('html_files'), list)):
+        return manifest
+    return None
+
+def save_manifest(manifest, manifest_path=HTML_MANIFEST):
+    try:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+    except OSError:
+        pass  # The manifest is only a cache
+
+def list_html_files(docs_dir, manifest_path=HTML_MANIFEST):
+    """Return the HTML files under docs_dir, reusing the cached listing if possible
+
+    The manifest records the mtime of every directory in the tree. Creating,
+    removing or renaming an entry bumps the mtime of its parent directory, so
+    while none of them changed the cached listing is still accurate and only
+    needs one stat per directory instead of a full walk.
+    """
+    docs_dir = str(docs_dir)
+    manifest = load_manifest(docs_dir, manifest_path)
+    try:
+        if manifest is not None and all(
+                os.stat(d).st_mtime_ns == mtime for d, mtime in manifest['dirs'].items()):
+            return manifest['html_files']
+    except (OSError, ValueError, TypeError):
+        pass
+    
+    dirs = {}
+    html_files = list(iter_html(docs_dir, dirs))
+    save_manifest({'docs_dir': docs_dir, 'dirs': dirs, 'html_files': html_files}, manifest_path)
+    return html_files
+
+def refresh_manifest(docs_dir, dirs, manifest_path=HTML_MANIFEST):
+    """Record the current mtime of dirs in the cached listing of docs_dir
+
+    atomic_write's temporary file and rename bump the mtime of the page's
+    directory without changing which pages it holds, so run() calls this for
+    every directory it wrote to; otherwise the next run would always walk the
+    tree again.
+    """
+    manifest = load_manifest(docs_dir, manifest_path)
+    if manifest is None:
+        return
+    for d in dirs:
+        if d in manifest['dirs']:
+            try:
+                manifest['dirs'][d] = os.stat(d).st_mtime_ns
+            except OSError:
+                pass
+    save_manifest(manifest, manifest_path)
+
+def load_sidecar(sidecar_path=MIGRATED_SIDECAR):
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return sidecar if isinstance(sidecar, dict) else {}
+
+def save_sidecar(sidecar, sidecar_path=MIGRATED_SIDECAR):
+    try:
+        with open(sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f)
+    except OSError:
+        pass  # The sidecar is only a cache
+
+def run(worker, verbose=False):
+    """Apply `worker` to every HTML page in the docs tree and print a summary
+
+    Pages that `worker` already migrated and that have not been modified
+    since are counted as skipped after a single stat, without being read.
+    Only the counts and any failures are printed unless `verbose` is set,
+    in which case every processed page gets a status line. A page where one
+    step failed but another updated it is counted as partially updated and
+    listed with the failures.
+    """
+    if not DOCS_DIR.is_dir():
+        sys.exit(f"Docs directory not found: {DOCS_DIR}")
+    html_files = list_html_files(DOCS_DIR)
+    
+    print(f"Found {len(html_files)} HTML files")
+    
+    updated = 0
+    partial = 0
+    skipped = 0
+    failed = 0
+    failures = []
+    log = []
+    
+    sidecar = load_sidecar()
+    migrated = sidecar.get(worker.__name__)
+    if not isinstance(migrated, dict):
+        migrated = sidecar[worker.__name__] = {}
+    mtimes = {}
+    pending = []
+    written_dirs = set()
+    for html_file in sorted(html_files):
+        mtimes[html_file] = os.stat(html_file).st_mtime_ns
+        if migrated.get(html_file) == mtimes[html_file]:
+            skipped += 1
+        else:
+            pending.append(html_file)
+    
+    # Phase 1: compute the new content of every page. Files are independent,
+    # so this is spread across all cores and nothing is written yet.
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(worker, pending, chunksize=16))
+    
+    # Phase 2: write back the pages that changed
+    for html_file, (status, complete, line, update) in zip(pending, results):
+        if verbose:
+            log.append(line)
+        if status == 'updated':
+            atomic_write(html_file, splice(*update))
+            written_dirs.add(os.path.dirname(html_file))
+            written_dirs.add(os.path.dirname(os.path.realpath(html_file)))
+            if complete:
+                updated += 1
+                migrated[html_file] = os.stat(html_file).st_mtime_ns
+            else:
+                # Another step failed, so the page is not done; retry it next run
+                partial += 1
+                failures.append(line)
+        elif status == 'skipped':
+            skipped += 1
+            migrated[html_file] = mtimes[html_file]
+        else:
+            failed += 1
+            failures.append(line)
+    
+    if pending:
+        save_sidecar(sidecar)
+    if written_dirs:
+        refresh_manifest(DOCS_DIR, written_dirs)
+    
+    if log:
+        print()
+        print('\n'.join(log))
+    print()
+    print(f"Updated: {updated}")
+    if partial:
+        print(f"Partially updated: {partial}")
+    print(f"Skipped: {skipped}")
+    print(f"Failed: {failed}")
+    if failures and not verbose:
+        print('\n'.join(failures))
+
+WORKERS = {
+    'all': apply_all,
+    'text-size': add_text_size_control,
+    'dark-mode': add_dark_mode_toggle,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add site controls to all HTML pages in Habitat docs")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="print a status line for every processed page")
+    
+    # -v is also accepted after the subcommand; it gets its own dest there so
+    # the subcommand's default cannot overwrite a -v given before it
+    subcommand_verbose = argparse.ArgumentParser(add_help=False)
+    subcommand_verbose.add_argument('-v', '--verbose', action='store_true', dest='subcommand_verbose',
+                                    help="print a status line for every processed page")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('all', parents=[subcommand_verbose],
+                          help="add the text-size control and dark mode toggle in one pass (default)")
+    subparsers.add_parser('text-size', parents=[subcommand_verbose], help="add the text-size control only")
+    subparsers.add_parser('dark-mode', parents=[subcommand_verbose], help="add the dark mode toggle only")
+    args = parser.parse_args(argv)
+    
+    verbose = args.verbose or getattr(args, 'subcommand_verbose', False)
+    run(WORKERS[args.command or 'all'], verbose=verbose)
+
+if __name__ == '__main__':
+    main()